@@ -12,12 +12,11 @@ Version: 0.2.0
 __version__ = "0.2.0"
 
 import logging
-
-from mcp.server.fastmcp import FastMCP
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from .api import check_connection
 from .settings import settings
-from .tools import register_all_tools
 
 # Configure logging
 logging.basicConfig(
@@ -26,11 +25,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-mcp = FastMCP("Comfy MCP Server")
 
-# Register all tools
-register_all_tools(mcp)
+@lru_cache(maxsize=1)
+def _build_mcp():
+    """Create the MCP server and register all tools.
+
+    Deferred until first use so importing the package stays cheap.
+    """
+    from mcp.server.fastmcp import FastMCP
+
+    from .tools import register_all_tools
+
+    server = FastMCP("Comfy MCP Server")
+    register_all_tools(server)
+    return server
+
+
+def __getattr__(name: str):
+    if name == "mcp":
+        return _build_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def run_server():
@@ -41,14 +55,18 @@ def run_server():
     print(f"  Output mode: {settings.output_mode}")
     print(f"  Poll timeout: {settings.poll_timeout}s")
 
-    # Test connection
-    connected, version = check_connection(timeout=5)
+    # Test connection while the server and its tools are being built
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        connection = pool.submit(check_connection, timeout=5)
+        server = _build_mcp()
+        connected, version = connection.result()
+
     if connected:
         print(f"  Connected to ComfyUI {version}")
     else:
         print("  Warning: Cannot connect to ComfyUI")
 
-    mcp.run()
+    server.run()
 
 
 # Export key components for testing
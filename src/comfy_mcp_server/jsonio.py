@@ -0,0 +1,40 @@
+"""JSON helpers for workflow files.
+
+Uses orjson when installed and falls back to the stdlib json module,
+including for integers orjson cannot represent exactly.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+
+# Integers outside the 64-bit range have at least 19 digits, and orjson reads
+# them as floats; documents with such a digit run go to the stdlib parser
+_LONG_INT_RISK = re.compile(rb"\d{19}")
+
+
+def json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it can represent every integer exactly."""
+    if orjson is not None and not _LONG_INT_RISK.search(data):
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, default=None) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available.
+
+    ``default`` converts otherwise unserializable objects, as in json.dumps.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which the stdlib encoder handles
+    return json.dumps(obj, indent=2, default=default).encode("utf-8")
@@ -1,12 +1,15 @@
 """Pydantic models for ComfyUI MCP Server.
 
 These models provide structured data validation for ComfyUI API responses
-and MCP tool parameters.
+and MCP tool parameters. Value objects that are built from trusted data
+and never need coercion are plain dataclasses.
 """
 
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 # === ComfyUI Response Models ===
 
@@ -48,18 +51,23 @@ class SystemStats(BaseModel):
 class QueueStatus(BaseModel):
     """Queue status from /queue endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     queue_running: list[list[Any]] = Field(default_factory=list)
     queue_pending: list[list[Any]] = Field(default_factory=list)
 
-    @property
+    @computed_field
+    @cached_property
     def running_count(self) -> int:
         return len(self.queue_running)
 
-    @property
+    @computed_field
+    @cached_property
     def pending_count(self) -> int:
         return len(self.queue_pending)
 
-    @property
+    @computed_field
+    @cached_property
     def is_empty(self) -> bool:
         return self.running_count == 0 and self.pending_count == 0
 
@@ -89,13 +97,12 @@ class NodeInfo(BaseModel):
 # === Workflow Models ===
 
 
-class WorkflowNode(BaseModel):
+@dataclass(frozen=True, slots=True)
+class WorkflowNode:
     """A node in a ComfyUI workflow."""
 
-    class_type: str = Field(description="Node class name")
-    inputs: dict[str, Any] = Field(
-        default_factory=dict, description="Node inputs (values or connections)"
-    )
+    class_type: str  # Node class name
+    inputs: dict[str, Any] = field(default_factory=dict)  # Values or connections
 
 
 class Workflow(BaseModel):
@@ -105,15 +112,18 @@ class Workflow(BaseModel):
 
     def to_api_format(self) -> dict:
         """Convert to ComfyUI API format."""
-        return {k: v.model_dump() for k, v in self.nodes.items()}
+        return {
+            k: {"class_type": v.class_type, "inputs": dict(v.inputs)} for k, v in self.nodes.items()
+        }
 
     @classmethod
     def from_api_format(cls, data: dict) -> "Workflow":
-        """Create from ComfyUI API format."""
-        nodes = {}
-        for node_id, node_data in data.items():
-            nodes[node_id] = WorkflowNode(**node_data)
-        return cls(nodes=nodes)
+        """Create from ComfyUI API format.
+
+        Nodes are validated in a single pydantic-core pass; extra node keys
+        such as '_meta' are ignored.
+        """
+        return cls.model_validate({"nodes": data})
 
     def add_node(self, node_id: str, class_type: str, inputs: dict) -> "Workflow":
         """Add a node to the workflow."""
@@ -124,15 +134,30 @@ class Workflow(BaseModel):
 # === Error Models ===
 
 
-class ErrorResponse(BaseModel):
-    """Structured error response for MCP tools."""
+@dataclass(frozen=True, slots=True)
+class ErrorResponse:
+    """Structured error response for MCP tools.
+
+    Instances are immutable, so the factories for errors that repeat verbatim
+    (unavailable, not_configured) hand out cached instances.
+    """
 
     error: str
     code: str
     details: dict | None = None
     suggestion: str | None = None
 
+    def to_dict(self) -> dict:
+        """Convert to a plain dict for tool responses."""
+        return {
+            "error": self.error,
+            "code": self.code,
+            "details": self.details,
+            "suggestion": self.suggestion,
+        }
+
     @classmethod
+    @lru_cache(maxsize=32)
     def unavailable(cls, message: str = "ComfyUI is not reachable") -> "ErrorResponse":
         return cls(
             error=message,
@@ -151,6 +176,7 @@ class ErrorResponse(BaseModel):
         )
 
     @classmethod
+    @lru_cache(maxsize=32)
     def not_configured(cls, setting: str) -> "ErrorResponse":
         return cls(
             error=f"{setting} not configured",
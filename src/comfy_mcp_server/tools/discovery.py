@@ -4,6 +4,7 @@ Impact: High (essential for workflow building)
 Complexity: Low-Medium (caching, filtering)
 """
 
+from typing import Annotated
 from urllib.error import HTTPError
 
 from mcp.server.fastmcp import Context
@@ -18,8 +19,10 @@ def register_discovery_tools(mcp):
 
     @mcp.tool()
     def list_nodes(
-        filter: str = Field(default=None, description="Filter by name (e.g., 'fal', 'image')"),
-        category: str = Field(default=None, description="Filter by category"),
+        filter: Annotated[
+            str | None, Field(description="Filter by name (e.g., 'fal', 'image')")
+        ] = None,
+        category: Annotated[str | None, Field(description="Filter by category")] = None,
         ctx: Context = None,
     ) -> list:
         """List available ComfyUI nodes.
@@ -51,7 +54,7 @@ def register_discovery_tools(mcp):
 
     @mcp.tool()
     def get_node_info(
-        node_name: str = Field(description="Exact node class name"),
+        node_name: Annotated[str, Field(description="Exact node class name")],
         ctx: Context = None,
     ) -> dict:
         """Get detailed info about a node.
@@ -78,16 +81,15 @@ def register_discovery_tools(mcp):
             return ErrorResponse.not_found(
                 f"Node '{node_name}'",
                 suggestion="Use list_nodes() to see available nodes",
-            ).model_dump()
+            ).to_dict()
         except Exception as e:
-            return ErrorResponse.unavailable(str(e)).model_dump()
+            return ErrorResponse.unavailable(str(e)).to_dict()
 
     @mcp.tool()
     def list_models(
-        folder: str = Field(
-            default="checkpoints",
-            description="Model folder: checkpoints, loras, vae, embeddings",
-        ),
+        folder: Annotated[
+            str, Field(description="Model folder: checkpoints, loras, vae, embeddings")
+        ] = "checkpoints",
         ctx: Context = None,
     ) -> list:
         """List available models in a folder.
@@ -172,7 +174,7 @@ def register_discovery_tools(mcp):
 
     @mcp.tool()
     def search_nodes(
-        query: str = Field(description="Search query"),
+        query: Annotated[str, Field(description="Search query")],
         ctx: Context = None,
     ) -> list:
         """Search for nodes by name, category, or description.
@@ -7,11 +7,13 @@ Complexity: High (polling, error handling, image retrieval)
 import json
 import urllib
 from pathlib import Path
+from typing import Annotated
 
 from mcp.server.fastmcp import Context, Image
 from pydantic import Field
 
 from ..api import comfy_get, comfy_post, get_file_url, poll_for_result
+from ..jsonio import json_loads
 from ..models import ErrorResponse
 from ..settings import settings
 
@@ -21,9 +23,9 @@ def register_execution_tools(mcp):
 
     @mcp.tool()
     def run_workflow(
-        workflow_name: str = Field(description="Workflow filename"),
-        inputs: dict = Field(default=None, description="Node input overrides"),
-        output_node_id: str = Field(default=None, description="Output node ID"),
+        workflow_name: Annotated[str, Field(description="Workflow filename")],
+        inputs: Annotated[dict | None, Field(description="Node input overrides")] = None,
+        output_node_id: Annotated[str | None, Field(description="Output node ID")] = None,
         ctx: Context = None,
     ) -> Image | str:
         """Execute a saved workflow file.
@@ -39,14 +41,13 @@ def register_execution_tools(mcp):
             return "Error: COMFY_WORKFLOWS_DIR not configured"
 
         wf_path = Path(settings.workflows_dir) / workflow_name
-        if not wf_path.exists():
-            return f"Error: Workflow '{workflow_name}' not found"
-
         if ctx:
             ctx.info(f"Loading workflow: {workflow_name}")
 
-        with open(wf_path) as f:
-            workflow = json.load(f)
+        try:
+            workflow = json_loads(wf_path.read_bytes())
+        except FileNotFoundError:
+            return f"Error: Workflow '{workflow_name}' not found"
 
         # Apply input overrides
         if inputs:
@@ -67,8 +68,8 @@ def register_execution_tools(mcp):
 
     @mcp.tool()
     def execute_workflow(
-        workflow: dict = Field(description="Complete workflow dict"),
-        output_node_id: str = Field(description="Node ID to get output from"),
+        workflow: Annotated[dict, Field(description="Complete workflow dict")],
+        output_node_id: Annotated[str, Field(description="Node ID to get output from")],
         ctx: Context = None,
     ) -> Image | str:
         """Execute an arbitrary workflow dict.
@@ -86,7 +87,7 @@ def register_execution_tools(mcp):
 
     @mcp.tool()
     def generate_image(
-        prompt: str = Field(description="Text prompt for image generation"),
+        prompt: Annotated[str, Field(description="Text prompt for image generation")],
         ctx: Context = None,
     ) -> Image | str:
         """Generate an image using the default workflow.
@@ -107,8 +108,7 @@ def register_execution_tools(mcp):
         if not settings.output_node_id:
             return "Error: OUTPUT_NODE_ID not configured"
 
-        with open(settings.workflow_json_file) as f:
-            workflow = json.load(f)
+        workflow = json_loads(Path(settings.workflow_json_file).read_bytes())
 
         workflow[settings.prompt_node_id]["inputs"]["text"] = prompt
 
@@ -119,7 +119,7 @@ def register_execution_tools(mcp):
 
     @mcp.tool()
     def submit_workflow(
-        workflow: dict = Field(description="Workflow to submit"),
+        workflow: Annotated[dict, Field(description="Workflow to submit")],
         ctx: Context = None,
     ) -> dict:
         """Submit a workflow without waiting for completion.
@@ -140,7 +140,7 @@ def register_execution_tools(mcp):
                 error=f"Submit failed: status {status}",
                 code="SUBMIT_FAILED",
                 details=resp,
-            ).model_dump()
+            ).to_dict()
 
         return {
             "prompt_id": resp.get("prompt_id"),
@@ -150,7 +150,7 @@ def register_execution_tools(mcp):
 
     @mcp.tool()
     def get_prompt_status(
-        prompt_id: str = Field(description="Prompt ID to check"),
+        prompt_id: Annotated[str, Field(description="Prompt ID to check")],
         ctx: Context = None,
     ) -> dict:
         """Get the status of a submitted prompt.
@@ -177,12 +177,12 @@ def register_execution_tools(mcp):
                 "has_outputs": len(entry.get("outputs", {})) > 0,
             }
         except Exception as e:
-            return ErrorResponse.unavailable(str(e)).model_dump()
+            return ErrorResponse.unavailable(str(e)).to_dict()
 
     @mcp.tool()
     def get_result_image(
-        prompt_id: str = Field(description="Prompt ID"),
-        output_node_id: str = Field(description="Output node ID"),
+        prompt_id: Annotated[str, Field(description="Prompt ID")],
+        output_node_id: Annotated[str, Field(description="Output node ID")],
         ctx: Context = None,
     ) -> Image | str:
         """Get the result image from a completed prompt.
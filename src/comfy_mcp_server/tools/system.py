@@ -4,6 +4,8 @@ Impact: High (essential for debugging and monitoring)
 Complexity: Low (simple API calls)
 """
 
+from typing import Annotated
+
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
@@ -31,7 +33,7 @@ def register_system_tools(mcp):
             stats = SystemStats(**data)
             return stats.model_dump()
         except Exception as e:
-            return ErrorResponse.unavailable(str(e)).model_dump()
+            return ErrorResponse.unavailable(str(e)).to_dict()
 
     @mcp.tool()
     def get_queue_status(ctx: Context) -> dict:
@@ -48,18 +50,13 @@ def register_system_tools(mcp):
         ctx.info("Fetching queue status...")
         try:
             data = comfy_get("/queue")
-            status = QueueStatus(**data)
-            result = status.model_dump()
-            result["running_count"] = status.running_count
-            result["pending_count"] = status.pending_count
-            result["is_empty"] = status.is_empty
-            return result
+            return QueueStatus(**data).model_dump()
         except Exception as e:
-            return ErrorResponse.unavailable(str(e)).model_dump()
+            return ErrorResponse.unavailable(str(e)).to_dict()
 
     @mcp.tool()
     def get_history(
-        limit: int = Field(default=10, ge=1, le=100, description="Max entries to return"),
+        limit: Annotated[int, Field(ge=1, le=100, description="Max entries to return")] = 10,
         ctx: Context = None,
     ) -> dict:
         """Get recent generation history.
@@ -75,11 +72,11 @@ def register_system_tools(mcp):
         try:
             return comfy_get(f"/history?max_items={limit}")
         except Exception as e:
-            return ErrorResponse.unavailable(str(e)).model_dump()
+            return ErrorResponse.unavailable(str(e)).to_dict()
 
     @mcp.tool()
     def cancel_current(
-        prompt_id: str = Field(default=None, description="Specific prompt ID to cancel"),
+        prompt_id: Annotated[str | None, Field(description="Specific prompt ID to cancel")] = None,
         ctx: Context = None,
     ) -> str:
         """Interrupt current generation.
@@ -100,7 +97,9 @@ def register_system_tools(mcp):
 
     @mcp.tool()
     def clear_queue(
-        delete_ids: list = Field(default=None, description="Specific prompt IDs to delete"),
+        delete_ids: Annotated[
+            list | None, Field(description="Specific prompt IDs to delete")
+        ] = None,
         ctx: Context = None,
     ) -> str:
         """Clear the queue or delete specific items.
@@ -4,15 +4,61 @@ Impact: High (core functionality for automation)
 Complexity: Medium (file operations, template management)
 """
 
+import contextlib
 import json
+import os
+import sys
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType
+from typing import Annotated
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
+from ..jsonio import json_dumps, json_loads
 from ..models import ErrorResponse
 from ..settings import settings
 
+# Node dict keys, interned so lookups can hit the identity fast path
+_CLASS_TYPE = sys.intern("class_type")
+_INPUTS = sys.intern("inputs")
+
+# First characters of any JSON document, after the whitespace JSON allows
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_START_CHARS = frozenset('[{"-0123456789tfn')
+
+
+def _reject_constant(name: str):
+    """Refuse NaN/Infinity so update_node_input keeps them as text."""
+    raise ValueError(f"{name} is not valid JSON")
+
+
+@lru_cache(maxsize=1)
+def _workflows_path(workflows_dir: str) -> Path:
+    return Path(workflows_dir)
+
+
+def _wf_dir() -> Path | None:
+    """Get the configured workflows directory, or None if not set."""
+    if not settings.workflows_dir:
+        return None
+    return _workflows_path(settings.workflows_dir)
+
+
+@lru_cache(maxsize=64)
+def _read_workflow(path: Path, mtime_ns: int, ctime_ns: int, size: int, ino: int) -> bytes:
+    """Read a workflow file, cached until its stat signature changes.
+
+    mtime has coarse resolution on some filesystems, so a same-size rewrite
+    can keep it; the inode (new on every atomic save) and ctime catch that.
+
+    Raw bytes are cached rather than the parsed dict: re-parsing hands every
+    caller its own mutable copy and is much cheaper than copy.deepcopy.
+    """
+    return path.read_bytes()
+
+
 # === Workflow Templates ===
 TEMPLATES = {
     "empty": {},
@@ -45,263 +91,329 @@ TEMPLATES = {
 }
 
 
-def register_workflow_tools(mcp):
-    """Register workflow management tools."""
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-    @mcp.tool()
-    def list_workflows(ctx: Context = None) -> list:
-        """List available workflow files.
-
-        Returns list of workflow JSON files in the configured workflows directory.
-        Use run_workflow() to execute a saved workflow.
-        """
-        if not settings.workflows_dir:
-            return ["Error: COMFY_WORKFLOWS_DIR not configured"]
-
-        if ctx:
-            ctx.info(f"Listing workflows in: {settings.workflows_dir}")
-
-        path = Path(settings.workflows_dir)
-        if not path.exists():
-            return []
-        return sorted([f.name for f in path.glob("*.json")])
-
-    @mcp.tool()
-    def load_workflow(
-        workflow_name: str = Field(description="Workflow filename"),
-        ctx: Context = None,
-    ) -> dict:
-        """Load a workflow file for inspection or modification.
-
-        Args:
-            workflow_name: Workflow filename (e.g., 'my-workflow.json')
-
-        Returns the workflow dict that can be modified and executed.
-        """
-        if not settings.workflows_dir:
-            return ErrorResponse.not_configured("COMFY_WORKFLOWS_DIR").model_dump()
-
-        wf_path = Path(settings.workflows_dir) / workflow_name
-        if not wf_path.exists():
-            return ErrorResponse.not_found(
-                f"Workflow '{workflow_name}'",
-                suggestion="Use list_workflows() to see available workflows",
-            ).model_dump()
-
-        if ctx:
-            ctx.info(f"Loading workflow: {workflow_name}")
-
-        with open(wf_path) as f:
-            return json.load(f)
-
-    @mcp.tool()
-    def save_workflow(
-        workflow: dict = Field(description="Workflow to save"),
-        name: str = Field(description="Filename (without .json)"),
-        ctx: Context = None,
-    ) -> str:
-        """Save a workflow to the workflows directory.
-
-        Args:
-            workflow: Workflow dict to save
-            name: Filename (with or without .json extension)
-
-        Returns path to saved file or error message.
-        """
-        if not settings.workflows_dir:
-            return "Error: COMFY_WORKFLOWS_DIR not configured"
-
-        if not name.endswith(".json"):
-            name = f"{name}.json"
-
-        path = Path(settings.workflows_dir) / name
-
-        if ctx:
-            ctx.info(f"Saving to: {path}")
-
-        try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w") as f:
-                json.dump(workflow, f, indent=2)
-            return f"Saved: {path}"
-        except Exception as e:
-            return f"Error: {e}"
-
-    @mcp.tool()
-    def create_workflow(ctx: Context = None) -> dict:
-        """Create an empty workflow structure.
-
-        Returns an empty dict that you can populate with add_node().
-        """
-        if ctx:
-            ctx.info("Creating new workflow")
-        return {}
-
-    @mcp.tool()
-    def add_node(
-        workflow: dict = Field(description="Workflow dict to modify"),
-        node_id: str = Field(description="Unique node ID (e.g., '1', 'prompt')"),
-        node_type: str = Field(description="Node class name"),
-        inputs: dict = Field(description="Node inputs"),
-        ctx: Context = None,
-    ) -> dict:
-        """Add a node to a workflow.
-
-        Args:
-            workflow: Existing workflow dict
-            node_id: Unique identifier for this node
-            node_type: Node class name (use list_nodes() to find)
-            inputs: Input values. For connections use ["source_node_id", output_index].
-
-        Examples:
-            # Simple value input
-            add_node(wf, "1", "StringInput_fal", {"text": "a cat"})
-
-            # Connection to another node
-            add_node(wf, "2", "CLIPTextEncode", {
-                "text": "prompt",
-                "clip": ["1", 0]  # Connect to node "1" output 0
-            })
-
-        Returns the modified workflow dict.
-        """
-        if ctx:
-            ctx.info(f"Adding node {node_id}: {node_type}")
-
-        workflow[node_id] = {"class_type": node_type, "inputs": inputs}
-        return workflow
 
-    @mcp.tool()
-    def remove_node(
-        workflow: dict = Field(description="Workflow dict to modify"),
-        node_id: str = Field(description="Node ID to remove"),
-        ctx: Context = None,
-    ) -> dict:
-        """Remove a node from a workflow.
-
-        Args:
-            workflow: Workflow dict to modify
-            node_id: ID of node to remove
-
-        Warning: This doesn't update connections from other nodes.
-        """
-        if ctx:
-            ctx.info(f"Removing node: {node_id}")
-
-        if node_id in workflow:
-            del workflow[node_id]
-        return workflow
+# Read-only snapshot of TEMPLATES taken at import; everything served comes from it
+_FROZEN_TEMPLATES = _freeze(TEMPLATES)
+
+# One factory per template, each returning a fresh mutable copy. Templates are
+# pre-serialized so a copy is a single JSON parse rather than a deepcopy.
+_TEMPLATE_FACTORIES = {
+    name: partial(json_loads, json_dumps(template, default=dict)) if template else dict
+    for name, template in _FROZEN_TEMPLATES.items()
+}
+
 
-    @mcp.tool()
-    def update_node_input(
-        workflow: dict = Field(description="Workflow dict to modify"),
-        node_id: str = Field(description="Node ID to update"),
-        input_name: str = Field(description="Input name to update"),
-        value: str = Field(description="New value (or JSON for complex values)"),
-        ctx: Context = None,
-    ) -> dict:
-        """Update a specific input on a node.
-
-        Args:
-            workflow: Workflow dict to modify
-            node_id: Node ID to update
-            input_name: Name of the input to update
-            value: New value (use JSON string for lists/dicts)
-
-        Returns the modified workflow dict.
-        """
-        if ctx:
-            ctx.info(f"Updating {node_id}.{input_name}")
-
-        if node_id not in workflow:
-            return workflow
-
-        # Try to parse as JSON for complex values
-        try:
-            parsed_value = json.loads(value)
-        except json.JSONDecodeError:
-            parsed_value = value
-
-        workflow[node_id]["inputs"][input_name] = parsed_value
+def list_workflows(ctx: Context = None) -> list:
+    """List available workflow files.
+
+    Returns list of workflow JSON files in the configured workflows directory.
+    Use run_workflow() to execute a saved workflow.
+    """
+    path = _wf_dir()
+    if path is None:
+        return ["Error: COMFY_WORKFLOWS_DIR not configured"]
+
+    if ctx:
+        ctx.info(f"Listing workflows in: {path}")
+
+    # scandir reuses the d_type from readdir, so no per-entry stat is needed
+    try:
+        with os.scandir(path) as entries:
+            names = [e.name for e in entries if e.name.endswith(".json") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    names.sort()
+    return names
+
+
+def load_workflow(
+    workflow_name: Annotated[str, Field(description="Workflow filename")],
+    ctx: Context = None,
+) -> dict:
+    """Load a workflow file for inspection or modification.
+
+    Args:
+        workflow_name: Workflow filename (e.g., 'my-workflow.json')
+
+    Returns the workflow dict that can be modified and executed.
+    """
+    wf_dir = _wf_dir()
+    if wf_dir is None:
+        return ErrorResponse.not_configured("COMFY_WORKFLOWS_DIR").to_dict()
+
+    wf_path = wf_dir / workflow_name
+    try:
+        st = wf_path.stat()
+        data = _read_workflow(wf_path, st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+    except FileNotFoundError:
+        return ErrorResponse.not_found(
+            f"Workflow '{workflow_name}'",
+            suggestion="Use list_workflows() to see available workflows",
+        ).to_dict()
+
+    if ctx:
+        ctx.info(f"Loading workflow: {workflow_name}")
+
+    return json_loads(data)
+
+
+def save_workflow(
+    workflow: Annotated[dict, Field(description="Workflow to save")],
+    name: Annotated[str, Field(description="Filename (without .json)")],
+    ctx: Context = None,
+) -> str:
+    """Save a workflow to the workflows directory.
+
+    Args:
+        workflow: Workflow dict to save
+        name: Filename (with or without .json extension)
+
+    Returns path to saved file or error message.
+    """
+    wf_dir = _wf_dir()
+    if wf_dir is None:
+        return "Error: COMFY_WORKFLOWS_DIR not configured"
+
+    if not name.endswith(".json"):
+        name = f"{name}.json"
+
+    path = wf_dir / name
+
+    if ctx:
+        ctx.info(f"Saving to: {path}")
+
+    # Write to a temporary sibling and rename it into place, so readers never
+    # see a partially written workflow
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        payload = json_dumps(workflow)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+        return f"Saved: {path}"
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        return f"Error: {e}"
+
+
+def create_workflow(ctx: Context = None) -> dict:
+    """Create an empty workflow structure.
+
+    Returns an empty dict that you can populate with add_node().
+    """
+    if ctx:
+        ctx.info("Creating new workflow")
+    return {}
+
+
+def add_node(
+    workflow: Annotated[dict, Field(description="Workflow dict to modify")],
+    node_id: Annotated[str, Field(description="Unique node ID (e.g., '1', 'prompt')")],
+    node_type: Annotated[str, Field(description="Node class name")],
+    inputs: Annotated[dict, Field(description="Node inputs")],
+    ctx: Context = None,
+) -> dict:
+    """Add a node to a workflow.
+
+    Args:
+        workflow: Existing workflow dict
+        node_id: Unique identifier for this node
+        node_type: Node class name (use list_nodes() to find)
+        inputs: Input values. For connections use ["source_node_id", output_index].
+
+    Examples:
+        # Simple value input
+        add_node(wf, "1", "StringInput_fal", {"text": "a cat"})
+
+        # Connection to another node
+        add_node(wf, "2", "CLIPTextEncode", {
+            "text": "prompt",
+            "clip": ["1", 0]  # Connect to node "1" output 0
+        })
+
+    Returns the modified workflow dict.
+    """
+    if ctx:
+        ctx.info(f"Adding node {node_id}: {node_type}")
+
+    workflow[node_id] = {_CLASS_TYPE: node_type, _INPUTS: inputs}
+    return workflow
+
+
+def remove_node(
+    workflow: Annotated[dict, Field(description="Workflow dict to modify")],
+    node_id: Annotated[str, Field(description="Node ID to remove")],
+    ctx: Context = None,
+) -> dict:
+    """Remove a node from a workflow.
+
+    Args:
+        workflow: Workflow dict to modify
+        node_id: ID of node to remove
+
+    Warning: This doesn't update connections from other nodes.
+    """
+    if ctx:
+        ctx.info(f"Removing node: {node_id}")
+
+    if node_id in workflow:
+        del workflow[node_id]
+    return workflow
+
+
+def update_node_input(
+    workflow: Annotated[dict, Field(description="Workflow dict to modify")],
+    node_id: Annotated[str, Field(description="Node ID to update")],
+    input_name: Annotated[str, Field(description="Input name to update")],
+    value: Annotated[str, Field(description="New value (or JSON for complex values)")],
+    ctx: Context = None,
+) -> dict:
+    """Update a specific input on a node.
+
+    Args:
+        workflow: Workflow dict to modify
+        node_id: Node ID to update
+        input_name: Name of the input to update
+        value: New value (use JSON string for lists/dicts)
+
+    Returns the modified workflow dict.
+    """
+    if ctx:
+        ctx.info(f"Updating {node_id}.{input_name}")
+
+    if node_id not in workflow:
         return workflow
 
-    @mcp.tool()
-    def get_workflow_template(
-        template_name: str = Field(
-            description="Template: 'fal-flux-dev', 'fal-flux-schnell', 'empty'"
-        ),
-        ctx: Context = None,
-    ) -> dict:
-        """Get a pre-built workflow template.
-
-        Args:
-            template_name: One of:
-                - 'empty': Empty workflow
-                - 'fal-flux-dev': Flux Dev via fal.ai (higher quality)
-                - 'fal-flux-schnell': Flux Schnell via fal.ai (faster)
-
-        Returns a workflow dict that can be modified and executed.
-        """
-        if ctx:
-            ctx.info(f"Loading template: {template_name}")
-
-        if template_name not in TEMPLATES:
-            return ErrorResponse.not_found(
-                f"Template '{template_name}'",
-                suggestion=f"Available: {list(TEMPLATES.keys())}",
-            ).model_dump()
-
-        # Return a copy to avoid modifying the original
-        return json.loads(json.dumps(TEMPLATES[template_name]))
-
-    @mcp.tool()
-    def list_templates(ctx: Context = None) -> list:
-        """List available workflow templates.
-
-        Returns list of template names for get_workflow_template().
-        """
-        if ctx:
-            ctx.info("Listing templates")
-        return list(TEMPLATES.keys())
-
-    @mcp.tool()
-    def validate_workflow(
-        workflow: dict = Field(description="Workflow to validate"),
-        ctx: Context = None,
-    ) -> dict:
-        """Validate a workflow structure.
-
-        Args:
-            workflow: Workflow dict to validate
-
-        Returns validation result with any issues found.
-        """
-        if ctx:
-            ctx.info("Validating workflow")
-
-        issues = []
-        node_ids = set(workflow.keys())
-
-        for node_id, node in workflow.items():
-            # Check required fields
-            if "class_type" not in node:
-                issues.append(f"Node {node_id}: missing class_type")
-            if "inputs" not in node:
-                issues.append(f"Node {node_id}: missing inputs")
-
-            # Check connections reference valid nodes
-            if "inputs" in node:
-                for input_name, value in node["inputs"].items():
-                    if isinstance(value, list) and len(value) == 2:
-                        ref_node = str(value[0])
-                        if ref_node not in node_ids:
-                            issues.append(
-                                f"Node {node_id}.{input_name}: "
-                                f"references non-existent node {ref_node}"
-                            )
-
-        return {
-            "valid": len(issues) == 0,
-            "node_count": len(workflow),
-            "issues": issues,
-        }
+    # Try to parse as JSON for complex values; plain text skips the parser
+    parsed_value = value
+    text = value.lstrip(_JSON_WHITESPACE)
+    if text and text[0] in _JSON_START_CHARS:
+        with contextlib.suppress(ValueError):
+            parsed_value = json.loads(value, parse_constant=_reject_constant)
+
+    workflow[node_id][_INPUTS][input_name] = parsed_value
+    return workflow
+
+
+def get_workflow_template(
+    template_name: Annotated[
+        str, Field(description="Template: 'fal-flux-dev', 'fal-flux-schnell', 'empty'")
+    ],
+    ctx: Context = None,
+) -> dict:
+    """Get a pre-built workflow template.
+
+    Args:
+        template_name: One of:
+            - 'empty': Empty workflow
+            - 'fal-flux-dev': Flux Dev via fal.ai (higher quality)
+            - 'fal-flux-schnell': Flux Schnell via fal.ai (faster)
+
+    Returns a workflow dict that can be modified and executed.
+    """
+    if ctx:
+        ctx.info(f"Loading template: {template_name}")
+
+    factory = _TEMPLATE_FACTORIES.get(template_name)
+    if factory is None:
+        return ErrorResponse.not_found(
+            f"Template '{template_name}'",
+            suggestion=f"Available: {list(_TEMPLATE_FACTORIES)}",
+        ).to_dict()
+
+    # Each call builds a new copy, so the original is never modified
+    return factory()
+
+
+def list_templates(ctx: Context = None) -> list:
+    """List available workflow templates.
+
+    Returns list of template names for get_workflow_template().
+    """
+    if ctx:
+        ctx.info("Listing templates")
+    return list(_TEMPLATE_FACTORIES)
+
+
+def validate_workflow(
+    workflow: Annotated[dict, Field(description="Workflow to validate")],
+    ctx: Context = None,
+) -> dict:
+    """Validate a workflow structure.
+
+    Args:
+        workflow: Workflow dict to validate
+
+    Returns validation result with any issues found.
+    """
+    if ctx:
+        ctx.info("Validating workflow")
+
+    issues = []
+    node_ids = workflow.keys()
+
+    for node_id, node in workflow.items():
+        # Check node structure: {"class_type": str, "inputs": dict}
+        if not isinstance(node, dict):
+            issues.append(f"Node {node_id}: must be an object")
+            continue
+        if _CLASS_TYPE not in node:
+            issues.append(f"Node {node_id}: missing class_type")
+        elif not isinstance(node[_CLASS_TYPE], str):
+            issues.append(f"Node {node_id}: class_type must be a string")
+        if _INPUTS not in node:
+            issues.append(f"Node {node_id}: missing inputs")
+            continue
+        inputs = node[_INPUTS]
+        if not isinstance(inputs, dict):
+            issues.append(f"Node {node_id}: inputs must be an object")
+            continue
+
+        # Check connections reference valid nodes
+        for input_name, value in inputs.items():
+            if not (isinstance(value, list) and len(value) == 2):
+                continue
+            # Only ["node_id", output_index] pairs are connections
+            ref_node = value[0]
+            if isinstance(ref_node, int):
+                ref_node = str(ref_node)
+            elif not isinstance(ref_node, str):
+                continue
+            if ref_node not in node_ids:
+                issues.append(
+                    f"Node {node_id}.{input_name}: references non-existent node {ref_node}"
+                )
+
+    return {
+        "valid": len(issues) == 0,
+        "node_count": len(workflow),
+        "issues": issues,
+    }
+
+
+WORKFLOW_TOOLS = [
+    list_workflows,
+    load_workflow,
+    save_workflow,
+    create_workflow,
+    add_node,
+    remove_node,
+    update_node_input,
+    get_workflow_template,
+    list_templates,
+    validate_workflow,
+]
+
+
+def register_workflow_tools(mcp):
+    """Register workflow management tools."""
+    for tool in WORKFLOW_TOOLS:
+        mcp.tool()(tool)
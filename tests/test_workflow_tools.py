@@ -0,0 +1,262 @@
+"""Tests for the workflow management tools.
+
+Run with: uv run pytest tests/test_workflow_tools.py -v
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from comfy_mcp_server.tools import workflow
+from comfy_mcp_server.tools.workflow import (
+    TEMPLATES,
+    WORKFLOW_TOOLS,
+    add_node,
+    create_workflow,
+    get_workflow_template,
+    list_templates,
+    list_workflows,
+    load_workflow,
+    register_workflow_tools,
+    remove_node,
+    save_workflow,
+    update_node_input,
+    validate_workflow,
+)
+
+
+@pytest.fixture
+def workflows_dir(tmp_path, monkeypatch):
+    """Point the workflows directory at a temporary path."""
+    monkeypatch.setattr(workflow.settings, "workflows_dir", str(tmp_path))
+    return tmp_path
+
+
+# === Workflow File Tests ===
+class TestWorkflowFiles:
+    """Test loading and saving workflow files."""
+
+    def test_list_workflows(self, workflows_dir):
+        """Test only .json files are listed, sorted by name."""
+        (workflows_dir / "b.json").write_text("{}")
+        (workflows_dir / "a.json").write_text("{}")
+        (workflows_dir / "notes.txt").write_text("")
+        (workflows_dir / "dir.json").mkdir()
+        assert list_workflows() == ["a.json", "b.json"]
+
+    def test_list_workflows_missing_directory(self, workflows_dir, monkeypatch):
+        """Test a workflows directory that does not exist lists nothing."""
+        monkeypatch.setattr(workflow.settings, "workflows_dir", str(workflows_dir / "missing"))
+        assert list_workflows() == []
+
+    def test_list_workflows_path_is_file(self, workflows_dir, monkeypatch):
+        """Test a workflows path that points at a file lists nothing."""
+        path = workflows_dir / "file"
+        path.write_text("")
+        monkeypatch.setattr(workflow.settings, "workflows_dir", str(path))
+        assert list_workflows() == []
+
+    @pytest.mark.usefixtures("workflows_dir")
+    def test_load_workflow_missing(self):
+        """Test a missing workflow returns a NOT_FOUND error."""
+        result = load_workflow("missing.json")
+        assert result["code"] == "NOT_FOUND"
+        assert result["error"] == "Workflow 'missing.json' not found"
+
+    def test_load_workflow_deleted_after_stat(self, workflows_dir, monkeypatch):
+        """Test a file removed between stat and read returns a NOT_FOUND error."""
+        (workflows_dir / "wf.json").write_text("{}")
+
+        def deleted(*args):
+            raise FileNotFoundError
+
+        monkeypatch.setattr(workflow, "_read_workflow", deleted)
+        assert load_workflow("wf.json")["code"] == "NOT_FOUND"
+
+    def test_load_workflow_sees_rewritten_file(self, workflows_dir):
+        """Test load_workflow picks up a same-size rewrite that keeps the mtime."""
+        path = workflows_dir / "wf.json"
+        path.write_text('{"1": {"class_type": "A", "inputs": {}}}')
+        st = path.stat()
+        assert load_workflow("wf.json")["1"]["class_type"] == "A"
+        path.write_text('{"1": {"class_type": "B", "inputs": {}}}')
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert load_workflow("wf.json")["1"]["class_type"] == "B"
+
+    def test_save_workflow_writes_atomically(self, workflows_dir):
+        """Test save_workflow replaces the file and leaves no temp file behind."""
+        (workflows_dir / "wf.json").write_text("{}")
+        wf = {"1": {"class_type": "A", "inputs": {"text": "a"}}}
+        result = save_workflow(wf, "wf")
+        assert result == f"Saved: {workflows_dir / 'wf.json'}"
+        assert json.loads((workflows_dir / "wf.json").read_text()) == wf
+        assert os.listdir(workflows_dir) == ["wf.json"]
+
+    def test_large_integers_round_trip(self, workflows_dir):
+        """Test integers beyond 64 bits are saved and loaded exactly."""
+        seeds = {"big": 2**70, "low": -(2**63) - 1, "max": 2**64 - 1}
+        wf = {"1": {"class_type": "KSampler", "inputs": seeds}}
+        assert save_workflow(wf, "wf").startswith("Saved: ")
+        assert load_workflow("wf.json") == wf
+
+        (workflows_dir / "raw.json").write_text(
+            '{"1": {"class_type": "KSampler", "inputs": {"seed": 123456789012345678901234}}}'
+        )
+        assert load_workflow("raw.json")["1"]["inputs"]["seed"] == 123456789012345678901234
+
+    def test_save_workflow_cleans_up_on_failure(self, workflows_dir, monkeypatch):
+        """Test a failed save keeps the old file and removes the temp file."""
+        (workflows_dir / "wf.json").write_text("{}")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(workflow.os, "replace", fail_replace)
+        result = save_workflow({"1": {"class_type": "A", "inputs": {}}}, "wf")
+        assert result == "Error: disk full"
+        assert (workflows_dir / "wf.json").read_text() == "{}"
+        assert os.listdir(workflows_dir) == ["wf.json"]
+
+
+# === Template Tests ===
+class TestTemplates:
+    """Test workflow templates."""
+
+    def test_get_workflow_template_returns_independent_copies(self):
+        """Test each template call returns a fresh mutable copy."""
+        first = get_workflow_template("fal-flux-dev")
+        first["1"]["inputs"]["ckpt_name"] = "changed"
+        first["99"] = {"class_type": "Extra", "inputs": {}}
+        second = get_workflow_template("fal-flux-dev")
+        assert second == TEMPLATES["fal-flux-dev"]
+        assert second["1"]["inputs"]["ckpt_name"] == "fal-ai/flux/dev"
+        empty = get_workflow_template("empty")
+        empty["1"] = {}
+        assert get_workflow_template("empty") == {}
+
+    def test_served_templates_are_frozen_snapshot(self, monkeypatch):
+        """Test the served templates are read-only and ignore later TEMPLATES edits."""
+        frozen = workflow._FROZEN_TEMPLATES["fal-flux-dev"]
+        with pytest.raises(TypeError):
+            frozen["1"]["inputs"]["ckpt_name"] = "changed"
+        assert isinstance(frozen["7"]["inputs"]["images"], tuple)
+
+        monkeypatch.setitem(TEMPLATES["fal-flux-dev"]["1"]["inputs"], "ckpt_name", "changed")
+        assert get_workflow_template("fal-flux-dev")["1"]["inputs"]["ckpt_name"] == (
+            "fal-ai/flux/dev"
+        )
+
+    def test_listed_templates_are_served(self):
+        """Test every listed template can be fetched and unknown names list them."""
+        names = list_templates()
+        assert names == ["empty", "fal-flux-dev", "fal-flux-schnell"]
+        for name in names:
+            assert "error" not in get_workflow_template(name)
+        result = get_workflow_template("nonexistent")
+        assert result["code"] == "NOT_FOUND"
+        assert result["suggestion"] == f"Available: {names}"
+
+
+# === Tool Registration Tests ===
+class TestToolRegistration:
+    """Test the module-level workflow tools and their registration."""
+
+    def test_workflow_tools_callable_directly(self):
+        """Test workflow tools work as plain module-level functions."""
+        wf = add_node(create_workflow(), "1", "StringInput_fal", {"text": "a"})
+        wf = update_node_input(wf, "1", "text", "b")
+        assert wf["1"]["inputs"]["text"] == "b"
+        assert remove_node(wf, "1") == {}
+
+    def test_register_workflow_tools(self):
+        """Test every module-level workflow tool is registered by name."""
+        mcp = FastMCP("test")
+        register_workflow_tools(mcp)
+        names = {tool.name for tool in asyncio.run(mcp.list_tools())}
+        assert names == {tool.__name__ for tool in WORKFLOW_TOOLS}
+
+
+# === Node Input Tests ===
+class TestUpdateNodeInput:
+    """Test value parsing in update_node_input."""
+
+    @staticmethod
+    def _update(value):
+        wf = {"1": {"class_type": "A", "inputs": {}}}
+        return update_node_input(wf, "1", "x", value)["1"]["inputs"]["x"]
+
+    @pytest.mark.parametrize(
+        "value",
+        ["a cat in a hat", "", "   ", "\xa05", "{not json", "NaN", "Infinity", "-Infinity"],
+    )
+    def test_text_kept_as_string(self, value):
+        """Test plain text, invalid JSON and NaN/Infinity are stored unchanged."""
+        assert self._update(value) == value
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("512", 512),
+            (" 1.5\n", 1.5),
+            ("true", True),
+            ("null", None),
+            ('"quoted"', "quoted"),
+            ('["1", 0]', ["1", 0]),
+            ('{"a": [1, 2]}', {"a": [1, 2]}),
+        ],
+    )
+    def test_json_values_parsed(self, value, expected):
+        """Test JSON scalars, lists and objects are parsed."""
+        assert self._update(value) == expected
+
+    @pytest.mark.parametrize("number", [2**70, 2**64 - 1, -(2**63) - 1])
+    def test_large_integers_exact(self, number):
+        """Test integers beyond 64 bits are stored exactly."""
+        result = self._update(str(number))
+        assert type(result) is int
+        assert result == number
+
+    def test_unknown_node_unchanged(self):
+        """Test updating a missing node leaves the workflow as-is."""
+        wf = {"1": {"class_type": "A", "inputs": {}}}
+        assert update_node_input(wf, "2", "x", "1") == {"1": {"class_type": "A", "inputs": {}}}
+
+
+# === Validation Tests ===
+class TestValidateWorkflow:
+    """Test workflow structure validation."""
+
+    def test_validate_workflow_valid(self):
+        """Test a well-formed connected workflow has no issues."""
+        result = validate_workflow(
+            {
+                "1": {"class_type": "StringInput_fal", "inputs": {"text": "a"}},
+                "2": {"class_type": "CLIPTextEncode", "inputs": {"text": ["1", 0]}},
+            }
+        )
+        assert result == {"valid": True, "node_count": 2, "issues": []}
+
+    def test_validate_workflow_node_field_types(self):
+        """Test malformed nodes are reported instead of raising."""
+        result = validate_workflow(
+            {
+                "1": "not a node",
+                "2": {"inputs": {}},
+                "3": {"class_type": 3, "inputs": {}},
+                "4": {"class_type": "A"},
+                "5": {"class_type": "A", "inputs": ["x"]},
+                "6": {"class_type": "A", "inputs": {"x": ["9", 0]}},
+            }
+        )
+        assert result["valid"] is False
+        assert result["issues"] == [
+            "Node 1: must be an object",
+            "Node 2: missing class_type",
+            "Node 3: class_type must be a string",
+            "Node 4: missing inputs",
+            "Node 5: inputs must be an object",
+            "Node 6.x: references non-existent node 9",
+        ]